@@ -0,0 +1,525 @@
+import streamlit as st
+import os
+import logging
+import multiprocessing
+import json
+import time
+from collections import Counter
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import tempfile
+import threading
+import re
+
+from pdf_worker import extract_pdf_pages
+
+logger = logging.getLogger(__name__)
+
+# Optional libraries, imported once; None when not installed
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+try:
+    import textstat
+except ImportError:
+    textstat = None
+
+# Entity patterns, compiled once at import
+_DATE_RE = re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b|\b\d{4}\b')
+_PCT_RE = re.compile(r'\b\d+(?:\.\d+)?%')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Uploads parsed as documents by extension; anything else is decoded as text
+_EXTENSION_TYPES = {'.pdf': 'pdf', '.docx': 'docx'}
+# PDF readers accept the header anywhere in the first 1 KB
+_PDF_HEADER_WINDOW = 1024
+
+# PDFs with at least this many pages are extracted across worker processes.
+# At ~3ms/page, smaller files save less than the ~50ms pool startup
+_PARALLEL_PDF_MIN_PAGES = 32
+
+# Words excluded from key topics
+_STOP_WORDS = frozenset({'the', 'and', 'are', 'for', 'with', 'this', 'that', 'from', 'they', 'have', 'been', 'will', 'can', 'was', 'were', 'not', 'you', 'your', 'but', 'all', 'may', 'said', 'each', 'which', 'their', 'time'})
+
+# Tokenizer: emails, dates and percentages are tried before words so their
+# letters/digits are not swallowed by the word branch. Words are whole runs of
+# Unicode letters (joined by apostrophes or hyphens) or nothing at all. The
+# leading lookahead lets the scanner skip characters that cannot start a token.
+_TOKEN_RE = re.compile(
+    r"(?=[\w.%+-])"
+    f"(?:(?P<email>{_EMAIL_RE.pattern})"
+    f"|(?P<date>{_DATE_RE.pattern})"
+    f"|(?P<pct>{_PCT_RE.pattern})"
+    r"|(?P<word>\b[^\W\d_]+(?:['’-][^\W\d_]+)*\b))"
+)
+# A sentence with its own terminator(s); a trailing fragment counts too
+_SENTENCE_RE = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+
+# Configure page
+st.set_page_config(
+    page_title="Document Analyzer",
+    page_icon="📄",
+    layout="centered",
+    initial_sidebar_state="collapsed"
+)
+
+# Custom CSS for modern UI
+st.markdown("""
+<style>
+    .main-header {
+        text-align: center;
+        padding: 2rem 0;
+        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+    }
+    
+    .metric-card {
+        background: #f8f9fa;
+        padding: 1rem;
+        border-radius: 8px;
+        border-left: 4px solid #667eea;
+        margin: 0.5rem 0;
+    }
+    
+    .result-section {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 10px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+    }
+    
+    .topic-tag {
+        display: inline-block;
+        background: #e3f2fd;
+        color: #1976d2;
+        padding: 0.3rem 0.8rem;
+        border-radius: 20px;
+        margin: 0.2rem;
+        font-size: 0.9rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+def check_libraries():
+    """Check available libraries"""
+    return {
+        'pdf': PyPDF2 is not None,
+        'docx': Document is not None,
+        'textstat': textstat is not None
+    }
+
+def _warm_up_textstat():
+    """Load textstat's syllable dictionaries with a throwaway score"""
+    try:
+        textstat.flesch_reading_ease("Warm up the readability dictionaries.")
+    except Exception:
+        pass
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_textstat():
+    """Start the textstat warm-up in a background thread, once per process"""
+    thread = threading.Thread(target=_warm_up_textstat, daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource
+def _get_pdf_pool():
+    """Process pool for PDF extraction, shared across reruns"""
+    # Never fork the multithreaded Streamlit server; forkserver imports the
+    # app once and forks workers from that clean process
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context(start_method)
+    )
+
+def _extract_pdf_parallel(file_path, page_count):
+    """Extract PDF pages in contiguous chunks, one per worker; None on pool failure"""
+    chunk = -(-page_count // os.cpu_count())
+    try:
+        pool = _get_pdf_pool()
+        futures = [
+            pool.submit(extract_pdf_pages, file_path, start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)
+        ]
+        return [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        logger.warning("PDF worker pool broke; extracting serially", exc_info=True)
+        _get_pdf_pool.clear()
+    except Exception:
+        logger.warning("Parallel PDF extraction failed; extracting serially", exc_info=True)
+    return None
+
+def _sniff_file_type(head):
+    """Document type from the upload's leading bytes, or None if unrecognized"""
+    if b'%PDF' in head[:_PDF_HEADER_WINDOW]:
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        return 'docx'
+    return None
+
+def _extract_text(file_path, file_type):
+    """Extract text from different file types; raises on failure"""
+    if file_type == 'pdf':
+        if PyPDF2 is None:
+            raise ImportError("PyPDF2 is not installed")
+        with open(file_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            page_count = len(reader.pages)
+            parts = None
+            if page_count >= _PARALLEL_PDF_MIN_PAGES and (os.cpu_count() or 1) > 1:
+                parts = _extract_pdf_parallel(file_path, page_count)
+            if parts is None:
+                parts = [page.extract_text() for page in reader.pages]
+        return "\n".join(parts).strip()
+    
+    elif file_type == 'docx':
+        if Document is None:
+            raise ImportError("python-docx is not installed")
+        doc = Document(file_path)
+        # Kept serial: paragraph.text evaluates XPath in Python under the
+        # GIL, so a thread pool only adds scheduling overhead
+        parts = [paragraph.text for paragraph in doc.paragraphs]
+        return "\n".join(parts).strip()
+    
+    else:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+            return file.read()
+
+def extract_text_from_file(file_path, file_type):
+    """Extract text from different file types"""
+    try:
+        return _extract_text(file_path, file_type)
+    except Exception as e:
+        return f"Error extracting text: {str(e)}"
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _analyze_text(text):
+    """Compute text metadata (cached by content)"""
+    # Basic stats
+    words = text.split() if text else []
+    word_count = len(words)
+    char_count = len(text)
+    
+    # Document type detection
+    text_lower = text.lower()
+    if any(word in text_lower for word in ['abstract', 'introduction', 'methodology', 'conclusion']):
+        doc_type = "📚 Academic Paper"
+    elif any(word in text_lower for word in ['executive', 'business', 'market', 'strategy']):
+        doc_type = "💼 Business Document"
+    elif any(word in text_lower for word in ['chapter', 'novel', 'story']):
+        doc_type = "📖 Literary Work"
+    elif word_count < 100:
+        doc_type = "📝 Short Document"
+    else:
+        doc_type = "📄 General Document"
+    
+    # Readability score
+    readability = 0
+    try:
+        if textstat and text:
+            _prewarm_textstat().join()
+            readability = textstat.flesch_reading_ease(text)
+    except:
+        pass
+    
+    # Key topics and entities: matches stream straight into Counter (tallied
+    # in C, no per-token list), so the Python loop below runs once per
+    # distinct token rather than per match
+    token_counts = Counter(map(re.Match.groups, _TOKEN_RE.finditer(text)))
+    # Counter keys are unique and in first-seen order, so entities come out
+    # deduplicated and in document order without a set
+    topic_counts = Counter()
+    dates, percentages, emails = [], [], []
+    for (email, date, pct, word), count in token_counts.items():
+        if word:
+            word = word.lower()
+            if len(word) > 3 and word not in _STOP_WORDS:
+                topic_counts[word] += count
+        elif email:
+            emails.append(email)
+        elif date:
+            dates.append(date)
+        else:
+            percentages.append(pct)
+    topics = [word for word, count in topic_counts.most_common(8)]
+    
+    # Simple summary (first two sentences); the scan stops after the second
+    segments = (match.group().strip() for match in _SENTENCE_RE.finditer(text))
+    sentences = list(islice(filter(None, segments), 2))
+    summary = ' '.join(sentences) if len(sentences) >= 2 else text[:200] + "..."
+    
+    return {
+        'word_count': word_count,
+        'char_count': char_count,
+        'doc_type': doc_type,
+        'readability': readability,
+        'topics': topics,
+        'summary': summary,
+        'dates': dates[:5],
+        'percentages': percentages[:5],
+        'emails': emails[:3]
+    }
+
+def analyze_document(text, filename):
+    """Analyze document and generate metadata"""
+    start_time = time.time()
+    results = {'filename': filename, **_analyze_text(text)}
+    results['processing_time'] = time.time() - start_time
+    return results
+
+# Built-in sample documents for the "Try Sample" input method
+_SAMPLE_DOCUMENTS = {
+    "Research Paper": """Abstract: Machine learning applications in healthcare have shown remarkable progress in recent years. This study examines the implementation of deep learning algorithms for medical image analysis. Introduction: Artificial intelligence is revolutionizing healthcare diagnostics. Our methodology involves convolutional neural networks trained on medical imaging datasets. Results indicate 95% accuracy in tumor detection. Conclusion: AI-powered diagnostic tools show great promise for improving patient outcomes.""",
+    
+    "Business Report": """Executive Summary: Q3 financial results show strong growth across all business segments. Revenue increased 18% year-over-year to $2.4 billion, driven by digital transformation initiatives. Market expansion in Asia-Pacific region contributed 25% of total growth. Strategic recommendations include investing in cloud infrastructure and expanding our e-commerce platform. Customer satisfaction scores improved to 89%, reflecting our commitment to service excellence.""",
+    
+    "Technical Guide": """Installation Instructions: This guide covers the setup process for our new software platform. System Requirements: Windows 10 or macOS 10.15+, 8GB RAM minimum, 20GB available storage. Step 1: Download the installer from our official website. Step 2: Run the installer with administrator privileges. Step 3: Configure database connections and API endpoints. Troubleshooting: Common issues include firewall blocking port 8080 and insufficient disk space."""
+}
+
+@st.cache_resource(show_spinner=False)
+def _sample_analyses():
+    """Analyze the built-in samples once per process (filename and timing excluded)"""
+    return {name: _analyze_text(text) for name, text in _SAMPLE_DOCUMENTS.items()}
+
+def main():
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>📄 Document Analyzer</h1>
+        <p>Upload documents or paste text to extract insights and metadata</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Check available libraries
+    libs = check_libraries()
+    if libs['textstat']:
+        # Dictionary loading overlaps with input and file extraction
+        _prewarm_textstat()
+    if not all(libs.values()):
+        with st.expander("⚠️ Optional Features Available"):
+            if not libs['pdf']:
+                st.code("pip install PyPDF2  # For PDF support")
+            if not libs['docx']:
+                st.code("pip install python-docx  # For Word documents")
+            if not libs['textstat']:
+                st.code("pip install textstat  # For readability scores")
+    
+    # Input method selection
+    st.subheader("Choose Input Method")
+    input_method = st.radio(
+        "",
+        ["📁 Upload File", "✍️ Paste Text", "🎯 Try Sample"],
+        horizontal=True
+    )
+    
+    text_content = ""
+    filename = ""
+    
+    if input_method == "📁 Upload File":
+        uploaded_file = st.file_uploader(
+            "Choose a file",
+            type=['txt', 'pdf', 'docx', 'md', 'py', 'js', 'html', 'css'],
+            help="Supports: TXT, PDF, DOCX, MD, and code files"
+        )
+        
+        if uploaded_file:
+            filename = uploaded_file.name
+            # The file signature overrides the extension; the extension is the fallback
+            extension_type = _EXTENSION_TYPES.get(os.path.splitext(filename)[1].lower(), 'text')
+            sniffed_type = _sniff_file_type(bytes(uploaded_file.getbuffer()[:_PDF_HEADER_WINDOW]))
+            file_type = sniffed_type or extension_type
+            text_content = None
+            
+            try:
+                if file_type != 'text':
+                    # PDF/DOCX parsers read from disk; text types skip the tempfile
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=f'.{file_type}') as tmp_file:
+                        tmp_file.write(uploaded_file.getbuffer())
+                        tmp_path = tmp_file.name
+                    try:
+                        if extension_type == 'text':
+                            # Only the signature says binary (e.g. a .txt that
+                            # starts with "%PDF"); read it as text if parsing fails
+                            try:
+                                text_content = _extract_text(tmp_path, file_type)
+                            except Exception:
+                                logger.info("%s looked like %s but did not parse; reading as text",
+                                            filename, file_type, exc_info=True)
+                        else:
+                            text_content = extract_text_from_file(tmp_path, file_type)
+                    finally:
+                        os.unlink(tmp_path)
+                if text_content is None:
+                    # Decode straight from the upload buffer without a bytes copy
+                    text_content = str(uploaded_file.getbuffer(), 'utf-8', 'ignore')
+            except Exception as e:
+                st.error(f"Error reading file: {str(e)}")
+    
+    elif input_method == "✍️ Paste Text":
+        filename = st.text_input("Document name (optional)", "pasted_text.txt")
+        text_content = st.text_area(
+            "Paste your text here:",
+            height=150,
+            placeholder="Enter or paste your text content here..."
+        )
+    
+    elif input_method == "🎯 Try Sample":
+        selected_sample = st.selectbox("Choose a sample:", list(_SAMPLE_DOCUMENTS.keys()))
+        text_content = _SAMPLE_DOCUMENTS[selected_sample]
+        filename = f"{selected_sample.lower().replace(' ', '_')}.txt"
+        
+        st.text_area("Sample text:", text_content, height=100, disabled=True)
+    
+    # Analyze button
+    if st.button("🚀 Analyze Document", type="primary", use_container_width=True):
+        if text_content:
+            with st.spinner("🔍 Analyzing document..."):
+                if input_method == "🎯 Try Sample":
+                    start_time = time.time()
+                    results = {'filename': filename, **_sample_analyses()[selected_sample]}
+                    results['processing_time'] = time.time() - start_time
+                else:
+                    results = analyze_document(text_content, filename)
+                
+                # Display results
+                st.success("✅ Analysis Complete!")
+                
+                # Quick stats row
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("Words", results['word_count'])
+                with col2:
+                    st.metric("Characters", results['char_count'])
+                with col3:
+                    st.metric("Type", results['doc_type'].split(' ', 1)[1])
+                with col4:
+                    st.metric("Readability", f"{results['readability']:.0f}" if results['readability'] else "N/A")
+                
+                # Summary section
+                st.subheader("📋 Summary")
+                st.write(results['summary'])
+                
+                # Topics section
+                if results['topics']:
+                    st.subheader("🏷️ Key Topics")
+                    topics_html = "".join([f'<span class="topic-tag">{topic}</span>' for topic in results['topics'][:6]])
+                    st.markdown(topics_html, unsafe_allow_html=True)
+                
+                # Entities found
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if results['dates']:
+                        st.subheader("📅 Dates Found")
+                        for date in results['dates']:
+                            st.write(f"• {date}")
+                    
+                    if results['percentages']:
+                        st.subheader("📊 Percentages")
+                        for pct in results['percentages']:
+                            st.write(f"• {pct}")
+                
+                with col2:
+                    if results['emails']:
+                        st.subheader("📧 Email Addresses")
+                        for email in results['emails']:
+                            st.write(f"• {email}")
+                
+                # Download section
+                st.subheader("💾 Export Results")
+                
+                # Create JSON export
+                export_data = {
+                    "document_info": {
+                        "filename": results['filename'],
+                        "analysis_date": time.strftime('%Y-%m-%d %H:%M:%S'),
+                        "processing_time": f"{results['processing_time']:.2f}s"
+                    },
+                    "content_metrics": {
+                        "word_count": results['word_count'],
+                        "character_count": results['char_count'],
+                        "document_type": results['doc_type'],
+                        "readability_score": results['readability']
+                    },
+                    "extracted_data": {
+                        "summary": results['summary'],
+                        "key_topics": results['topics'],
+                        "dates": results['dates'],
+                        "percentages": results['percentages'],
+                        "email_addresses": results['emails']
+                    }
+                }
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.download_button(
+                        "📄 Download JSON Report",
+                        json.dumps(export_data, indent=2),
+                        f"analysis_{results['filename']}.json",
+                        "application/json",
+                        use_container_width=True
+                    )
+                
+                with col2:
+                    # Create text summary
+                    text_summary = f"""Document Analysis Report
+=====================================
+File: {results['filename']}
+Date: {time.strftime('%Y-%m-%d %H:%M:%S')}
+
+STATISTICS:
+- Words: {results['word_count']}
+- Characters: {results['char_count']}
+- Type: {results['doc_type']}
+- Readability: {results['readability']:.1f}
+
+SUMMARY:
+{results['summary']}
+
+KEY TOPICS:
+{', '.join(results['topics'][:6])}
+
+EXTRACTED ENTITIES:
+Dates: {', '.join(results['dates']) if results['dates'] else 'None'}
+Percentages: {', '.join(results['percentages']) if results['percentages'] else 'None'}
+Emails: {', '.join(results['emails']) if results['emails'] else 'None'}
+"""
+                    
+                    st.download_button(
+                        "📝 Download Text Summary",
+                        text_summary,
+                        f"summary_{results['filename']}.txt",
+                        "text/plain",
+                        use_container_width=True
+                    )
+                
+                # Raw data view
+                with st.expander("🔍 View Raw Data"):
+                    st.json(export_data)
+        
+        else:
+            st.warning("⚠️ Please provide some text content to analyze.")
+    
+    # Footer
+    st.markdown("---")
+    st.markdown(
+        "<div style='text-align: center; color: #666; font-size: 0.9rem;'>"
+        "Document Analyzer • Built with Streamlit"
+        "</div>", 
+        unsafe_allow_html=True
+    )
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""PDF page extraction for the app's worker processes.
+
+Kept out of app.py so tasks pickle as a reference to an importable module
+rather than to Streamlit's synthetic __main__.
+"""
+
+
+def extract_pdf_pages(file_path, start, stop):
+    """Extract text from PDF pages start..stop-1"""
+    import PyPDF2
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        return [reader.pages[i].extract_text() for i in range(start, stop)]